@@ -0,0 +1,237 @@
+"""Headless interaction-latency benchmark for the Streamlit apps.
+
+Drives each app through a scripted session (setup, adds, results, removals)
+with streamlit.testing and records how long every interaction takes and how
+big session state has grown. An interaction is one AppTest.run() after a
+click; handlers that call st.rerun() execute the script twice within it.
+new.py's season database is pointed at a fresh temporary file per session so
+a local season.sqlite3 doesn't skew the timings; --nights pre-fills it with
+that many saved nights so season-query cost is measured at scale. new.py is
+also run on every --courts setting, sets a player's availability and saves
+the night at the end. random is seeded per session so both versions being
+compared take the same scheduling path. Run it before and after a change and
+compare the JSON reports:
+
+    python benchmark_reruns.py --sizes 8,16,32 --nights 0,400 --results 50 --output bench.json
+"""
+import argparse
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import closing
+from pathlib import Path
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+APPS = ["badminton_shuffler.py", "new.py"]
+SETUP_PLAYERS = 4
+MATCHES_PER_NIGHT = 40
+
+
+def deep_sizeof(obj, seen=None):
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    return size
+
+
+def session_state_size(at):
+    return sum(deep_sizeof(value) for _, value in at.session_state.items())
+
+
+def find_button(at, label):
+    return next((b for b in at.button if b.label == label), None)
+
+
+def click(at, label):
+    find_button(at, label).click()
+
+
+class Session:
+    def __init__(self, app, timeout):
+        self.at = AppTest.from_file(app, default_timeout=timeout)
+        self.samples = []
+
+    def run(self, interaction):
+        start = time.perf_counter()
+        self.at.run()
+        elapsed = time.perf_counter() - start
+        if self.at.exception:
+            raise RuntimeError(f"{interaction} failed: {self.at.exception[0].message}")
+        self.samples.append({
+            "interaction": interaction,
+            "players": len(self.at.session_state["players"]),
+            "matches": len(self.at.session_state["match_history"]),
+            "seconds": elapsed,
+            "state_bytes": session_state_size(self.at),
+        })
+
+
+def prefill_season(db_path, nights, roster):
+    # Same row layout save_session_to_season writes: one row per player per match
+    rng = random.Random(nights)
+    with closing(sqlite3.connect(db_path)) as conn, conn:
+        for night in range(nights):
+            played_on = f"{2000 + night // 365}-{night % 12 + 1:02d}-{night % 28 + 1:02d}"
+            session_id = conn.execute("INSERT INTO sessions (played_on) VALUES (?)", (played_on,)).lastrowid
+            rows = []
+            for match_index in range(1, MATCHES_PER_NIGHT + 1):
+                a, b, c, d = rng.sample(roster, 4)
+                for team, won in (((a, b), 1), ((c, d), 0)):
+                    for player, partner in (team, team[::-1]):
+                        rows.append((session_id, played_on, match_index, 0, player, partner, won))
+            conn.executemany(
+                "INSERT INTO match_players (session_id, played_on, match_index, court, player, partner, won) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+    st.cache_data.clear()
+
+
+def run_session(app, roster_size, num_courts, nights, num_results, seed, timeout):
+    random.seed(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["BADMINTON_SEASON_DB"] = os.path.join(tmp, "season.sqlite3")
+        try:
+            return play_session(app, roster_size, num_courts, nights, num_results, timeout)
+        finally:
+            del os.environ["BADMINTON_SEASON_DB"]
+
+
+def submit_next(at, n, num_courts):
+    # Single court: the one Submit button. Several courts: finish one court per interaction, in turn
+    if num_courts == 1:
+        if find_button(at, "Submit Result") is None:
+            return False
+        click(at, "Submit Result")
+        return True
+    for offset in range(num_courts):
+        key = f"court_finished_{(n + offset) % num_courts}"
+        if any(c.key == key for c in at.checkbox):
+            at.checkbox(key=key).check()
+            click(at, "Submit Finished Results")
+            return True
+    return False
+
+
+def play_session(app, roster_size, num_courts, nights, num_results, timeout):
+    is_new = app.endswith("new.py")
+    session = Session(app, timeout)
+    at = session.at
+    at.run()
+
+    # Setup page
+    at.slider[0].set_value(SETUP_PLAYERS)
+    if is_new:
+        at.slider[1].set_value(num_courts)
+    at.run()
+    for i in range(1, SETUP_PLAYERS + 1):
+        at.text_input(key=f"player_{i}").input(f"P{i}")
+    click(at, "✅ Start Match")
+    session.run("setup")
+    if is_new and nights:
+        prefill_season(os.environ["BADMINTON_SEASON_DB"], nights, [f"P{i}" for i in range(1, roster_size + 1)])
+
+    # Grow the roster in one add
+    extra = [f"P{i}" for i in range(SETUP_PLAYERS + 1, roster_size + 1)]
+    if extra:
+        at.text_input(key="new_players_input").input(", ".join(extra))
+        click(at, "Add Players")
+        session.run("add")
+
+    if is_new:
+        at.selectbox(key="availability_player").set_value("P2")
+        at.run()
+        at.number_input(key="availability_leave_P2").set_value(at.session_state["match_number"] + num_results)
+        click(at, "Save Availability")
+        session.run("availability")
+
+    # Play, removing and re-adding a late player every tenth result;
+    # stop early if the app leaves no match to submit
+    results = 0
+    for n in range(1, num_results + 1):
+        if not submit_next(at, n, num_courts):
+            break
+        results += 1
+        session.run("result")
+        if n % 10 == 0 and len(at.session_state["players"]) > 4:
+            late = f"Late{n}"
+            at.text_input(key="new_players_input").input(late)
+            click(at, "Add Players")
+            session.run("add")
+            at.multiselect[0].select(late)
+            click(at, "Remove Selected Players")
+            session.run("remove")
+
+    if is_new:
+        click(at, "💾 Save Night to Season")
+        session.run("save")
+
+    return session.samples, results
+
+
+def summarize(samples, results, num_results):
+    seconds = sorted(s["seconds"] for s in samples)
+    return {
+        "interactions": len(seconds),
+        "results": results,
+        "truncated": results < num_results,
+        "mean_ms": statistics.fmean(seconds) * 1000,
+        "p50_ms": seconds[len(seconds) // 2] * 1000,
+        "p95_ms": seconds[min(len(seconds) - 1, int(len(seconds) * 0.95))] * 1000,
+        "max_ms": seconds[-1] * 1000,
+        "final_state_bytes": samples[-1]["state_bytes"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", default=",".join(APPS), help="comma-separated app scripts")
+    parser.add_argument("--sizes", default="8,16,32", help="comma-separated roster sizes")
+    parser.add_argument("--courts", default="1,2", help="comma-separated court counts (new.py only)")
+    parser.add_argument("--nights", default="0,100,400", help="comma-separated season nights to pre-fill (new.py only)")
+    parser.add_argument("--results", type=int, default=30, help="results submitted per session")
+    parser.add_argument("--seed", type=int, default=0, help="random seed applied at the start of every session")
+    parser.add_argument("--timeout", type=float, default=30, help="per-interaction timeout in seconds")
+    parser.add_argument("--output", help="write the full JSON report here")
+    args = parser.parse_args()
+
+    root = Path(__file__).parent
+    report = {"results_per_session": args.results, "seed": args.seed, "runs": []}
+    for app in args.apps.split(","):
+        is_new = app.endswith("new.py")
+        courts = [int(c) for c in args.courts.split(",")] if is_new else [1]
+        nights = [int(n) for n in args.nights.split(",")] if is_new else [0]
+        for size in (int(s) for s in args.sizes.split(",")):
+            for num_courts in courts:
+                if size < 4 * num_courts:
+                    continue
+                for num_nights in nights:
+                    samples, results = run_session(str(root / app), size, num_courts, num_nights,
+                                                   args.results, args.seed, args.timeout)
+                    summary = summarize(samples, results, args.results)
+                    report["runs"].append({"app": app, "roster_size": size, "courts": num_courts, "nights": num_nights,
+                                           "summary": summary, "samples": samples})
+                    truncated = f" TRUNCATED after {results} results" if summary["truncated"] else ""
+                    print(f"{app:<24} players={size:<4} courts={num_courts} nights={num_nights:<5} "
+                          f"interactions={summary['interactions']:<4} "
+                          f"mean={summary['mean_ms']:.1f}ms p95={summary['p95_ms']:.1f}ms "
+                          f"max={summary['max_ms']:.1f}ms state={summary['final_state_bytes']}B{truncated}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,12 @@
 import streamlit as st
+import os
 import random
+import sqlite3
+from bisect import bisect_left, bisect_right, insort
 from collections import defaultdict
+from contextlib import closing
+from datetime import date
+from pathlib import Path
 
 st.set_page_config(page_title="🏸 Badminton Match Shuffler", layout="centered")
 
@@ -8,7 +14,8 @@ st.set_page_config(page_title="🏸 Badminton Match Shuffler", layout="centered"
 if "players" not in st.session_state: st.session_state.players = []
 if "waiting_players" not in st.session_state: st.session_state.waiting_players = []
 if "match_history" not in st.session_state: st.session_state.match_history = []
-if "current_match" not in st.session_state: st.session_state.current_match = None
+if "num_courts" not in st.session_state: st.session_state.num_courts = 1
+if "current_matches" not in st.session_state: st.session_state.current_matches = [None]  # (team_a, team_b, match_number) or None per court
 if "win_streak" not in st.session_state: st.session_state.win_streak = {}
 if "last_losers" not in st.session_state: st.session_state.last_losers = []
 if "match_counts" not in st.session_state: st.session_state.match_counts = defaultdict(int)
@@ -16,46 +23,139 @@ if "win_counts" not in st.session_state: st.session_state.win_counts = defaultdi
 if "player_count" not in st.session_state: st.session_state.player_count = 4
 if "player_names_input" not in st.session_state: st.session_state.player_names_input = {}
 if "removed_players" not in st.session_state: st.session_state.removed_players = []
+if "active_players" not in st.session_state: st.session_state.active_players = {}  # player -> join order, for removed-free lookups
 if "last_played_time" not in st.session_state: st.session_state.last_played_time = defaultdict(lambda: -1)
 if "match_number" not in st.session_state: st.session_state.match_number = 0
 if "newly_joined_players" not in st.session_state: st.session_state.newly_joined_players = {}  # store join match number
 if "cooldown_players" not in st.session_state: st.session_state.cooldown_players = defaultdict(int)
+if "availability" not in st.session_state: st.session_state.availability = {}  # player -> (arrive_match, leave_after_match)
+if "arrival_index" not in st.session_state: st.session_state.arrival_index = []  # sorted (arrive_match, player)
+if "departure_index" not in st.session_state: st.session_state.departure_index = []  # sorted (leave_after_match, player)
+if "season_session_id" not in st.session_state: st.session_state.season_session_id = None  # set once the night is saved
+if "season_saved_matches" not in st.session_state: st.session_state.season_saved_matches = 0  # history length at the last save
 
 # --- Logic Functions ---
 def reset_all():
+    # Don't lose the night: anything played since the last season save is saved first
+    if len(st.session_state.match_history) > st.session_state.season_saved_matches:
+        save_session_to_season()
     st.session_state.players = []
     st.session_state.waiting_players = []
     st.session_state.match_history = []
-    st.session_state.current_match = None
+    st.session_state.num_courts = 1
+    st.session_state.current_matches = [None]
     st.session_state.win_streak = {}
     st.session_state.last_losers = []
     st.session_state.match_counts = defaultdict(int)
     st.session_state.win_counts = defaultdict(int)
     st.session_state.player_names_input = {}
     st.session_state.removed_players = []
+    st.session_state.active_players = {}
     st.session_state.last_played_time = defaultdict(lambda: -1)
     st.session_state.match_number = 0
     st.session_state.newly_joined_players = {}
     st.session_state.cooldown_players = defaultdict(int)
+    st.session_state.availability = {}
+    st.session_state.arrival_index = []
+    st.session_state.departure_index = []
+    st.session_state.season_session_id = None
+    st.session_state.season_saved_matches = 0
+
+def is_player_on_cooldown(player):
+    return st.session_state.cooldown_players.get(player, 0) > 0
 
 def get_active_players():
-    return [p for p in st.session_state.players if p not in st.session_state.removed_players]
+    return list(st.session_state.active_players)
+
+def in_roster_order(players):
+    return sorted(players, key=st.session_state.active_players.get)
+
+def set_player_availability(player, arrive_match=None, leave_after_match=None):
+    # Drop any previous window from both indexes before inserting the new one
+    old_arrive, old_leave = st.session_state.availability.pop(player, (None, None))
+    if old_arrive is not None:
+        st.session_state.arrival_index.remove((old_arrive, player))
+    if old_leave is not None:
+        st.session_state.departure_index.remove((old_leave, player))
+
+    if arrive_match is None and leave_after_match is None:
+        return
+    st.session_state.availability[player] = (arrive_match, leave_after_match)
+    if arrive_match is not None:
+        insort(st.session_state.arrival_index, (arrive_match, player))
+    if leave_after_match is not None:
+        insort(st.session_state.departure_index, (leave_after_match, player))
+
+def get_unavailable_players(match):
+    # Players who arrive after this match or leave before it: one bisect into each index
+    arrivals = st.session_state.arrival_index
+    departures = st.session_state.departure_index
+    not_arrived = arrivals[bisect_right(arrivals, match, key=lambda e: e[0]):]
+    leaving = departures[:bisect_left(departures, match, key=lambda e: e[0])]
+    return {p for _, p in not_arrived} | {p for _, p in leaving}
+
+def get_available_players(match):
+    return st.session_state.active_players.keys() - get_unavailable_players(match)
+
+def fill_idle_courts():
+    courts = st.session_state.current_matches
+    if len(courts) < st.session_state.num_courts or None in courts:
+        start_new_match()
+
+def get_players_on_court():
+    busy = set()
+    for match in st.session_state.current_matches:
+        if match:
+            busy.update(match[0] + match[1])
+    return busy
+
+def get_last_result(court):
+    for m in reversed(st.session_state.match_history):
+        if m.get("court", 0) == court:
+            return m
+    return None
 
 def start_new_match():
-    all_players = get_active_players()
+    # Fill every free court in one pass so cooldowns tick once per round
+    while len(st.session_state.current_matches) < st.session_state.num_courts:
+        st.session_state.current_matches.append(None)
+    free_courts = [c for c, m in enumerate(st.session_state.current_matches) if m is None]
+    busy = get_players_on_court()
+    available = get_available_players(st.session_state.match_number + 1)
+    all_players = in_roster_order(available - busy)
     if len(all_players) < 4:
-        st.session_state.current_match = None
-        st.warning("❗ Not enough active players (min 4) to start a match.")
-        return
+        st.warning("❗ Not enough available players (min 4) to start a match.")
+    elif free_courts:
+        # Decrease cooldown counters
+        for p in list(st.session_state.cooldown_players.keys()):
+            if st.session_state.cooldown_players[p] > 0:
+                st.session_state.cooldown_players[p] -= 1
+            if st.session_state.cooldown_players[p] <= 0:
+                del st.session_state.cooldown_players[p]
 
-    # Decrease cooldown counters
-    for p in list(st.session_state.cooldown_players.keys()):
-        if st.session_state.cooldown_players[p] > 0:
-            st.session_state.cooldown_players[p] -= 1
-        if st.session_state.cooldown_players[p] <= 0:
-            del st.session_state.cooldown_players[p]
+        for court in free_courts:
+            # Each court takes the next match number, so re-check who is still around for it;
+            # players who haven't arrived yet are never scheduled
+            busy = get_players_on_court()
+            available = get_available_players(st.session_state.match_number + 1)
+            all_players = in_roster_order(available - busy)
+            if len(all_players) >= 4:
+                fill_court(court, all_players, len(available))
+                if not st.session_state.current_matches[court]:
+                    # Too few players off cooldown: rather than leave the court empty, let it draw on them
+                    fill_court(court, all_players, len(available), use_cooldowns=False)
+            if not st.session_state.current_matches[court]:
+                st.warning(f"❗ Not enough available players to fill court {court + 1}.")
+                break
 
-    st.session_state.match_number += 1
+    busy = get_players_on_court()
+    st.session_state.waiting_players = in_roster_order(available - busy)
+
+def fill_court(court, all_players, roster_size, use_cooldowns=True):
+    # roster_size counts every available player, including those on other courts
+    last_result = get_last_result(court)
+    cooldown_players = st.session_state.cooldown_players if use_cooldowns else {}
+    ended_streak = None
 
     def pick_fair_four():
         def sort_key(p):
@@ -64,52 +164,49 @@ def start_new_match():
                 return (-1, st.session_state.last_played_time[p])
             return (st.session_state.match_counts[p], st.session_state.last_played_time[p])
 
-        eligible_players = [p for p in all_players if p not in st.session_state.cooldown_players]
+        eligible_players = [p for p in all_players if p not in cooldown_players]
         sorted_players = sorted(eligible_players, key=sort_key)
         return sorted_players[:4]
 
-    num_players = len(all_players)
-    if num_players in [5, 6]:
+    if roster_size in [5, 6] and len(pick_fair_four()) == 4:
         previous_winner = []
-        if st.session_state.match_history:
-            previous_winner = sorted(st.session_state.match_history[-1]["winner"])
+        if last_result:
+            previous_winner = sorted(last_result["winner"])
         for _ in range(100):
             selected_four = pick_fair_four()
             random.shuffle(selected_four)
             team_a, team_b = selected_four[:2], selected_four[2:]
             if sorted(team_a) != previous_winner and sorted(team_b) != previous_winner:
-                st.session_state.current_match = (team_a, team_b)
-                st.session_state.waiting_players = [p for p in all_players if p not in team_a + team_b]
                 break
         else:
             st.warning("⚠️ Could not reshuffle to avoid same winning team. Proceeding anyway.")
             selected_four = pick_fair_four()
             random.shuffle(selected_four)
             team_a, team_b = selected_four[:2], selected_four[2:]
-            st.session_state.current_match = (team_a, team_b)
-            st.session_state.waiting_players = [p for p in all_players if p not in team_a + team_b]
     else:
-        if st.session_state.match_history:
-            last_match = st.session_state.match_history[-1]
-            winner = [p for p in last_match["winner"] if p in all_players]
-            loser = [p for p in last_match["loser"] if p in all_players]
+        if last_result:
+            winner = [p for p in last_result["winner"] if p in all_players]
+            loser = [p for p in last_result["loser"] if p in all_players]
             winner_key = tuple(sorted(winner))
             streak = st.session_state.win_streak.get(winner_key, 0)
 
             if streak < 2 and len(winner) == 2:
-                waiting = [p for p in all_players if p not in winner and p not in loser and p not in st.session_state.cooldown_players]
+                waiting = [p for p in all_players if p not in winner and p not in loser and p not in cooldown_players]
                 random.shuffle(waiting)
                 if len(waiting) < 2:
-                    st.session_state.current_match = None
+                    # Small pool (e.g. the other court is busy): the losers get a rematch
+                    waiting += [p for p in loser if p not in cooldown_players]
+                if len(waiting) < 2:
                     st.warning("❗ Not enough waiting players to complete match with winning pair.")
                     return
                 next_match = winner + waiting[:2]
             else:
-                st.session_state.win_streak[winner_key] = 0
-                eligible = [p for p in all_players if p not in winner and p not in st.session_state.cooldown_players]
+                ended_streak = winner_key
+                eligible = [p for p in all_players if p not in winner and p not in cooldown_players]
                 random.shuffle(eligible)
                 if len(eligible) < 4:
-                    st.session_state.current_match = None
+                    eligible += [p for p in winner if p not in cooldown_players]
+                if len(eligible) < 4:
                     st.warning("❗ Not enough eligible players for next match.")
                     return
                 next_match = eligible[:4]
@@ -118,13 +215,21 @@ def start_new_match():
 
         team_a = next_match[:2]
         team_b = next_match[2:4]
-        st.session_state.current_match = (team_a, team_b)
-        st.session_state.waiting_players = [p for p in all_players if p not in team_a + team_b]
 
-def submit_match_result(winner_team):
-    if not st.session_state.current_match:
+    if len(team_a) < 2 or len(team_b) < 2:
+        st.warning("❗ Not enough players off cooldown for next match.")
         return
-    team_a, team_b = st.session_state.current_match
+    # Only touch state once the court is actually filled, so a failed attempt can be retried
+    if ended_streak is not None:
+        st.session_state.win_streak[ended_streak] = 0
+    if not use_cooldowns:
+        for p in team_a + team_b:
+            st.session_state.cooldown_players.pop(p, None)
+    st.session_state.match_number += 1
+    st.session_state.current_matches[court] = (team_a, team_b, st.session_state.match_number)
+
+def apply_match_result(court, winner_team):
+    team_a, team_b, match_number = st.session_state.current_matches[court]
     team_a = [p for p in team_a if p not in st.session_state.removed_players]
     team_b = [p for p in team_b if p not in st.session_state.removed_players]
 
@@ -139,7 +244,7 @@ def submit_match_result(winner_team):
 
     for player in team_a + team_b:
         st.session_state.match_counts[player] += 1
-        st.session_state.last_played_time[player] = st.session_state.match_number
+        st.session_state.last_played_time[player] = match_number
 
         if player in st.session_state.newly_joined_players:
             if st.session_state.match_counts[player] >= 2:
@@ -147,6 +252,8 @@ def submit_match_result(winner_team):
                 st.session_state.cooldown_players[player] = 2
 
     st.session_state.match_history.append({
+        "court": court,
+        "match_number": match_number,
         "team_a": team_a,
         "team_b": team_b,
         "winner": winner,
@@ -154,26 +261,129 @@ def submit_match_result(winner_team):
     })
     st.session_state.waiting_players += loser
     st.session_state.last_losers = loser
-    st.session_state.current_match = None
+    st.session_state.current_matches[court] = None
+
+def submit_match_results(results):
+    # results maps court -> "A"/"B"; applied all-or-nothing, then freed courts are refilled together
+    courts = st.session_state.current_matches
+    if not results or any(c >= len(courts) or not courts[c] for c in results):
+        return
+    for court, winner_team in sorted(results.items()):
+        apply_match_result(court, winner_team)
     start_new_match()
 
-def add_new_players(names_input):
+def submit_match_result(winner_team, court=0):
+    submit_match_results({court: winner_team})
+
+def add_new_players(names_input, arrive_match=None, leave_after_match=None):
     names = [name.strip() for name in names_input.split(",") if name.strip()]
     added, skipped = [], []
     for name in names:
         if name not in st.session_state.players and name not in st.session_state.removed_players:
             st.session_state.players.append(name)
+            st.session_state.active_players[name] = len(st.session_state.players)
             st.session_state.waiting_players.append(name)
             st.session_state.newly_joined_players[name] = st.session_state.match_number
+            set_player_availability(name, arrive_match, leave_after_match)
             added.append(name)
         else:
             skipped.append(name)
     if added:
         st.success(f"✅ Added: {', '.join(added)}")
+        fill_idle_courts()
         st.rerun()
     if skipped:
         st.warning(f"⚠️ Already present or removed: {', '.join(skipped)}")
         
+# --- Season Store ---
+SEASON_DB_PATH = Path(os.environ.get("BADMINTON_SEASON_DB", Path(__file__).with_name("season.sqlite3")))
+
+@st.cache_resource
+def init_season_db(path):
+    # Schema is created once per process and path; each caller opens its own connection
+    with closing(sqlite3.connect(path)) as conn:
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                id INTEGER PRIMARY KEY,
+                played_on TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS match_players (
+                session_id INTEGER NOT NULL REFERENCES sessions(id),
+                played_on TEXT NOT NULL,
+                match_index INTEGER NOT NULL,
+                court INTEGER NOT NULL,
+                player TEXT NOT NULL,
+                partner TEXT,
+                won INTEGER NOT NULL
+            );
+            DROP INDEX IF EXISTS idx_match_players_player;
+            CREATE INDEX IF NOT EXISTS idx_match_players_leaderboard ON match_players(player, played_on, session_id, won);
+            CREATE INDEX IF NOT EXISTS idx_match_players_partners ON match_players(player, partner, won);
+            CREATE INDEX IF NOT EXISTS idx_match_players_played_on ON match_players(played_on);
+            CREATE INDEX IF NOT EXISTS idx_match_players_session ON match_players(session_id);
+        """)
+    return path
+
+def get_season_db(db_path):
+    return closing(sqlite3.connect(init_season_db(db_path)))
+
+def save_session_to_season():
+    # One row per player per match, written in a single transaction; re-saving replaces the night
+    rows = []
+    for i, m in enumerate(st.session_state.match_history, 1):
+        for team in (m["team_a"], m["team_b"]):
+            won = int(team == m["winner"])
+            for player in team:
+                partner = next((p for p in team if p != player), None)
+                rows.append((i, m.get("court", 0), player, partner, won))
+    if not rows:
+        return 0
+
+    with get_season_db(SEASON_DB_PATH) as conn, conn:
+        session_id = st.session_state.season_session_id
+        if session_id is None:
+            played_on = date.today().isoformat()
+            session_id = conn.execute("INSERT INTO sessions (played_on) VALUES (?)", (played_on,)).lastrowid
+        else:
+            # Keep the night's original date even if it is re-saved after midnight
+            played_on = conn.execute("SELECT played_on FROM sessions WHERE id = ?", (session_id,)).fetchone()[0]
+            conn.execute("DELETE FROM match_players WHERE session_id = ?", (session_id,))
+        conn.executemany(
+            "INSERT INTO match_players (session_id, played_on, match_index, court, player, partner, won) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(session_id, played_on) + row for row in rows],
+        )
+    st.session_state.season_session_id = session_id
+    st.session_state.season_saved_matches = len(st.session_state.match_history)
+    get_season_leaderboard.clear()
+    get_season_partners.clear()
+    return len(st.session_state.match_history)
+
+# Season reads are cached so live-match reruns don't re-aggregate; saving clears them
+@st.cache_data
+def get_season_leaderboard(db_path, since=None):
+    with get_season_db(db_path) as conn:
+        return conn.execute("""
+            SELECT player,
+                   COUNT(*) AS matches,
+                   SUM(won) AS wins,
+                   COUNT(DISTINCT session_id) AS nights
+            FROM match_players
+            WHERE played_on >= COALESCE(?, '')
+            GROUP BY player
+            ORDER BY matches DESC, wins DESC
+        """, (since,)).fetchall()
+
+@st.cache_data
+def get_season_partners(db_path, player):
+    with get_season_db(db_path) as conn:
+        return conn.execute("""
+            SELECT partner, COUNT(*) AS matches, SUM(won) AS wins
+            FROM match_players
+            WHERE player = ? AND partner IS NOT NULL
+            GROUP BY partner
+            ORDER BY matches DESC, wins DESC
+        """, (player,)).fetchall()
+
 # --- UI Starts Here ---
 st.title("🏸 Badminton Match Shuffler")
 
@@ -183,6 +393,7 @@ if "players" not in st.session_state:
 if not st.session_state.players:
     st.header("👥 Add Players")
     st.session_state.player_count = st.slider("Number of players", 4, 9, value=4)
+    st.session_state.num_courts = st.slider("Number of courts", 1, 2, value=1)
     names = []
     for i in range(1, st.session_state.player_count + 1):
         name = st.text_input(f"Player {i} Name", key=f"player_{i}")
@@ -196,6 +407,7 @@ if not st.session_state.players:
             st.warning("At least 4 valid player names needed.")
         else:
             st.session_state.players = player_list
+            st.session_state.active_players = {p: i for i, p in enumerate(player_list)}
             st.session_state.waiting_players = player_list.copy()
             for p in player_list:
                 st.session_state.match_counts[p] = 0
@@ -206,34 +418,83 @@ if not st.session_state.players:
             st.rerun()
 else:
     st.header("🎮 Current Match")
-    if st.session_state.current_match:
-        team_a, team_b = st.session_state.current_match
-        team_a = [p for p in team_a if p not in st.session_state.removed_players]
-        team_b = [p for p in team_b if p not in st.session_state.removed_players]
-        if len(team_a) < 2 or len(team_b) < 2:
-            st.warning("❗ Current match has removed players. Resetting match.")
-            start_new_match()
-            st.rerun()
+    multi_court = st.session_state.num_courts > 1
+    finished_results = {}
+    for court, match in enumerate(st.session_state.current_matches):
+        if multi_court:
+            st.subheader(f"🏟️ Court {court + 1}")
+        if match:
+            team_a, team_b, _ = match
+            team_a = [p for p in team_a if p not in st.session_state.removed_players]
+            team_b = [p for p in team_b if p not in st.session_state.removed_players]
+            if len(team_a) < 2 or len(team_b) < 2:
+                st.warning("❗ Current match has removed players. Resetting match.")
+                st.session_state.current_matches[court] = None
+                start_new_match()
+                st.rerun()
+            else:
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.markdown("### 🅰️ Team A")
+                    st.success(", ".join(team_a))
+                with col2:
+                    st.markdown("### 🅱️ Team B")
+                    st.info(", ".join(team_b))
+                winner_choice = st.radio("🏆 Who won?", ["A", "B"], horizontal=True, key=f"winner_choice_{court}")
+                if not multi_court:
+                    if st.button("Submit Result"):
+                        submit_match_result(winner_choice)
+                        st.rerun()
+                elif st.checkbox("✅ Finished", key=f"court_finished_{court}"):
+                    finished_results[court] = winner_choice
         else:
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown("### 🅰️ Team A")
-                st.success(", ".join(team_a))
-            with col2:
-                st.markdown("### 🅱️ Team B")
-                st.info(", ".join(team_b))
-            winner_choice = st.radio("🏆 Who won?", ["A", "B"], horizontal=True)
-            if st.button("Submit Result"):
-                submit_match_result(winner_choice)
+            st.info("⚠️ No active match. Waiting to start.")
+            if st.button("▶️ Start Court", key=f"start_court_{court}"):
+                start_new_match()
                 st.rerun()
-    else:
-        st.info("⚠️ No active match. Waiting to start.")
+
+    if multi_court:
+        if st.button("Submit Finished Results"):
+            if finished_results:
+                for court in finished_results:
+                    del st.session_state[f"court_finished_{court}"]
+                submit_match_results(finished_results)
+                st.rerun()
+            else:
+                st.warning("⚠️ Mark at least one court as finished.")
 
     st.markdown("---")
     st.header("➕ Add New Players")
     new_players_input = st.text_input("Enter names (comma-separated)", key="new_players_input")
+    col1, col2 = st.columns(2)
+    with col1:
+        new_arrive = st.number_input("Arrives at match # (0 = now)", min_value=0, step=1, key="new_players_arrive")
+    with col2:
+        new_leave = st.number_input("Leaves after match # (0 = stays)", min_value=0, step=1, key="new_players_leave")
     if st.button("Add Players"):
-        add_new_players(new_players_input)
+        if new_arrive and new_leave and new_arrive > new_leave:
+            st.warning("⚠️ Arrival match must not be after the leaving match.")
+        else:
+            add_new_players(new_players_input, new_arrive or None, new_leave or None)
+
+    st.markdown("---")
+    st.header("⏰ Player Availability")
+    availability_player = st.selectbox("Player", get_active_players(), key="availability_player")
+    if availability_player:
+        current_arrive, current_leave = st.session_state.availability.get(availability_player, (None, None))
+        col1, col2 = st.columns(2)
+        with col1:
+            arrive = st.number_input("Arrives at match # (0 = now)", min_value=0, step=1, value=current_arrive or 0, key=f"availability_arrive_{availability_player}")
+        with col2:
+            leave = st.number_input("Leaves after match # (0 = stays)", min_value=0, step=1, value=current_leave or 0, key=f"availability_leave_{availability_player}")
+        if st.button("Save Availability"):
+            if arrive and leave and arrive > leave:
+                st.warning("⚠️ Arrival match must not be after the leaving match.")
+            else:
+                set_player_availability(availability_player, arrive or None, leave or None)
+                st.success(f"✅ Availability saved for {availability_player}")
+                fill_idle_courts()
+                st.rerun()
 
     st.markdown("---")
     st.header("❌ Remove Players")
@@ -244,6 +505,7 @@ else:
             for p in players_to_remove:
                 if p not in st.session_state.removed_players:
                     st.session_state.removed_players.append(p)
+                st.session_state.active_players.pop(p, None)
                 if p in st.session_state.waiting_players:
                     st.session_state.waiting_players.remove(p)
             st.success(f"✅ Removed: {', '.join(players_to_remove)}")
@@ -251,7 +513,8 @@ else:
 
     st.markdown("---")
     st.header("🧘 Waiting Players")
-    waiting = [p for p in st.session_state.waiting_players if p not in st.session_state.removed_players and not is_player_on_cooldown(p)]
+    unavailable = get_unavailable_players(st.session_state.match_number + 1)
+    waiting = [p for p in st.session_state.waiting_players if p not in st.session_state.removed_players and not is_player_on_cooldown(p) and p not in unavailable]
     st.markdown(" ".join([f"`{p}`" for p in waiting]) or "_None_")
 
     st.markdown("---")
@@ -261,12 +524,21 @@ else:
     st.markdown("---")
     st.header("📊 Matches Played")
     all_players = st.session_state.players + st.session_state.removed_players
+    on_court = get_players_on_court()
     for p in all_players:
         match_count = st.session_state.match_counts.get(p, 0)
         win_count = st.session_state.win_counts.get(p, 0)
         status = "🟢 Active" if p not in st.session_state.removed_players else "❌ Removed"
         cooldown_status = "🧊 Cooldown" if is_player_on_cooldown(p) else ""
-        st.markdown(f"- **{p}**: {match_count} matches | 🏆 {win_count} wins &nbsp;&nbsp;{status} {cooldown_status}")
+        arrive, leave = st.session_state.availability.get(p, (None, None))
+        window_status = ""
+        if arrive is not None and arrive > st.session_state.match_number + 1:
+            window_status = f"⏳ Arrives match {arrive}"
+        elif leave is not None and leave <= st.session_state.match_number and p not in on_court:
+            window_status = "👋 Left"
+        elif leave is not None:
+            window_status = f"👋 Leaves after match {leave}"
+        st.markdown(f"- **{p}**: {match_count} matches | 🏆 {win_count} wins &nbsp;&nbsp;{status} {cooldown_status} {window_status}")
 
     st.markdown("---")
     st.header("📜 Match History")
@@ -276,5 +548,29 @@ else:
     else:
         st.write("_No matches yet._")
 
+    st.markdown("---")
+    st.header("📅 Season")
+    if st.button("💾 Save Night to Season"):
+        saved = save_session_to_season()
+        if saved:
+            st.success(f"✅ Saved {saved} matches to the season.")
+        else:
+            st.warning("⚠️ No matches to save yet.")
+    since = st.date_input("Since", value=None, key="season_since")
+    leaderboard = get_season_leaderboard(SEASON_DB_PATH, since.isoformat() if since else None)
+    if leaderboard:
+        st.dataframe(
+            [{"Player": p, "Matches": m, "Wins": w, "Nights": n} for p, m, w, n in leaderboard],
+            hide_index=True,
+        )
+        partner_player = st.selectbox("Partner stats for", [row[0] for row in leaderboard], key="season_partner_player")
+        partners = get_season_partners(SEASON_DB_PATH, partner_player)
+        st.dataframe(
+            [{"Partner": p, "Matches": m, "Wins": w} for p, m, w in partners],
+            hide_index=True,
+        )
+    else:
+        st.write("_No season matches saved yet._")
+
     st.markdown("---")
     st.button("🔄 Reset All", on_click=lambda: (reset_all(), st.rerun()))
@@ -0,0 +1,99 @@
+import random
+import sqlite3
+from pathlib import Path
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+APP = str(Path(__file__).with_name("new.py"))
+
+
+@pytest.fixture(autouse=True)
+def season_db(tmp_path, monkeypatch):
+    monkeypatch.setenv("BADMINTON_SEASON_DB", str(tmp_path / "season.sqlite3"))
+
+
+def click(at, label):
+    next(b for b in at.button if b.label == label).click()
+    at.run()
+    assert not at.exception
+
+
+def start_session(names, num_courts=1):
+    at = AppTest.from_file(APP, default_timeout=30)
+    at.run()
+    at.slider[0].set_value(len(names))
+    at.slider[1].set_value(num_courts)
+    at.run()
+    for i, name in enumerate(names, 1):
+        at.text_input(key=f"player_{i}").input(name)
+    click(at, "✅ Start Match")
+    return at
+
+
+def submit_courts(at, results):
+    for court, winner in results.items():
+        at.radio(key=f"winner_choice_{court}").set_value(winner)
+        at.checkbox(key=f"court_finished_{court}").check()
+    click(at, "Submit Finished Results")
+
+
+def assert_courts_valid(at):
+    on_court = []
+    for match in at.session_state["current_matches"]:
+        assert match is not None, "court left idle"
+        team_a, team_b, _ = match
+        assert len(team_a) == 2 and len(team_b) == 2
+        on_court += team_a + team_b
+    assert len(on_court) == len(set(on_court)), "player on two courts"
+
+
+@pytest.mark.parametrize("num_players", [8, 9])
+@pytest.mark.parametrize("seed", range(3))
+def test_two_courts_stay_filled_without_sharing_players(num_players, seed):
+    random.seed(seed)
+    at = start_session([f"P{i}" for i in range(1, num_players + 1)], num_courts=2)
+    assert_courts_valid(at)
+    for results in [{0: "A"}, {1: "B"}, {0: "A", 1: "A"}, {0: "B"}] * 5:
+        submit_courts(at, results)
+        assert_courts_valid(at)
+
+
+def test_court_refills_when_its_players_are_on_cooldown():
+    random.seed(0)
+    at = start_session(list("abcdefgh"), num_courts=2)
+    submit_courts(at, {0: "A", 1: "A"})
+    submit_courts(at, {0: "B"})
+    assert_courts_valid(at)
+
+
+def test_last_played_time_uses_the_finished_courts_match():
+    random.seed(0)
+    at = start_session([f"P{i}" for i in range(1, 10)], num_courts=2)
+    team_a, team_b, match_number = at.session_state["current_matches"][0]
+    assert at.session_state["current_matches"][1][2] > match_number
+    submit_courts(at, {0: "A"})
+    for player in team_a + team_b:
+        assert at.session_state["last_played_time"][player] == match_number
+
+
+def test_late_arrival_is_not_scheduled_early():
+    random.seed(0)
+    at = start_session(list("abcd"))
+    at.text_input(key="new_players_input").input("e")
+    at.number_input(key="new_players_arrive").set_value(5)
+    click(at, "Add Players")
+    for _ in range(6):
+        click(at, "Submit Result")
+        team_a, team_b, match_number = at.session_state["current_matches"][0]
+        if match_number < 5:
+            assert "e" not in team_a + team_b
+
+
+def test_reset_saves_unsaved_night_to_season(tmp_path):
+    random.seed(0)
+    at = start_session(list("abcde"))
+    click(at, "Submit Result")
+    click(at, "🔄 Reset All")
+    with sqlite3.connect(tmp_path / "season.sqlite3") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM match_players").fetchone()[0] == 4